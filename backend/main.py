@@ -1,10 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from typing import Dict, Any
+import asyncio
 import uvicorn
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from models import SimulationRequest, SimulationResult, ScenariosResponse, ScenarioInfo, ScenarioType
@@ -17,7 +21,8 @@ from simulations.detailed import simulate_detailed
 app = FastAPI(
     title="BB84 Quantum Key Distribution Simulator",
     description="A simulator for BB84 quantum key distribution protocol with various scenarios",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for frontend access
@@ -29,6 +34,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (detailed simulations return hundreds of
+# per-qubit dicts); small responses pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.middleware("http")
+async def add_cache_headers(request, call_next):
+    """
+    Set long-lived caching headers on bundled frontend assets.
+
+    Vite emits content-hashed filenames under /assets, so browsers can cache
+    them forever and pick up changes via the new hash in index.html.
+    """
+    response = await call_next(request)
+    if request.url.path.startswith("/assets/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
 # Get the directory paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 FRONTEND_DIST = BASE_DIR / "frontend" / "dist"
@@ -41,6 +63,27 @@ SIMULATION_FUNCTIONS = {
     ScenarioType.DECOHERENCE_FREE: simulate_decoherence_free,
 }
 
+def _reseed_worker():
+    """Give each pool worker its own fresh generator.
+
+    Forked workers inherit a byte-identical copy of the parent's module
+    state, including utils._RNG - without reseeding, every worker would
+    produce the same 'random' keys.
+    """
+    import numpy as np
+    import utils
+    utils._RNG = np.random.default_rng()
+
+# Simulations are CPU-bound, so running them inline in an async handler would
+# block the event loop and serialize all concurrent requests. A process pool
+# lets simulations run on other cores while the loop keeps serving requests.
+SIMULATION_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_reseed_worker)
+
+async def run_in_pool(simulation_func, **params) -> Dict[str, Any]:
+    """Run a simulation function in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(SIMULATION_POOL, partial(simulation_func, **params))
+
 @app.get("/api", response_model=Dict[str, str])
 @app.get("/api/", response_model=Dict[str, str])
 async def root():
@@ -59,10 +102,10 @@ async def root():
         "docs": "/docs"
     }
 
-@app.get("/scenarios", response_model=ScenariosResponse)
-async def get_scenarios():
-    """Get list of available simulation scenarios."""
-    scenarios = [
+# The scenario catalog is static, so build and validate it once at import
+# instead of reconstructing the Pydantic models on every request
+SCENARIOS_RESPONSE = ScenariosResponse(
+    scenarios=[
         ScenarioInfo(
             id=ScenarioType.IDEAL,
             name="Ideal Conditions",
@@ -104,7 +147,12 @@ async def get_scenarios():
             }
         ),
     ]
-    return ScenariosResponse(scenarios=scenarios)
+)
+
+@app.get("/scenarios", response_model=ScenariosResponse)
+async def get_scenarios():
+    """Get list of available simulation scenarios."""
+    return SCENARIOS_RESPONSE
 
 @app.post("/simulate/detailed", response_model=Dict[str, Any])
 async def run_detailed_simulation(request: SimulationRequest):
@@ -113,70 +161,84 @@ async def run_detailed_simulation(request: SimulationRequest):
     Limited to 20 qubits for readability.
     """
     try:
-        params = request.model_dump()
-        result = simulate_detailed(**params)
+        result = await run_in_pool(
+            simulate_detailed,
+            qubit_count=request.qubit_count,
+            error_rate=request.error_rate,
+            eve_fraction=request.eve_fraction,
+            show_all=request.show_all
+        )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Detailed simulation failed: {str(e)}")
 
-@app.post("/simulate/{scenario}", response_model=SimulationResult)
-async def run_simulation(scenario: ScenarioType, request: SimulationRequest):
-    """Run a BB84 simulation for the specified scenario."""
-    try:
-        if scenario not in SIMULATION_FUNCTIONS:
-            raise HTTPException(status_code=400, detail="Invalid scenario type")
-        
-        simulation_func = SIMULATION_FUNCTIONS[scenario]
-        
-        # Prepare parameters for the simulation
-        params = request.model_dump()
-        
-        # Run the simulation
-        result = simulation_func(**params)
-        
-        return SimulationResult(**result)
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+def _make_post_handler(simulation_func):
+    """Build a POST handler bound to one simulation function."""
+    async def run_simulation(request: SimulationRequest):
+        """Run a BB84 simulation for this scenario."""
+        try:
+            result = await run_in_pool(
+                simulation_func,
+                qubit_count=request.qubit_count,
+                error_rate=request.error_rate,
+                eve_fraction=request.eve_fraction
+            )
+            return SimulationResult(**result)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+    return run_simulation
 
-@app.get("/simulate/{scenario}", response_model=SimulationResult)
-async def run_simulation_get(scenario: ScenarioType, qubit_count: int = 100, error_rate: float = 0.0, eve_fraction: float = 0.0):
-    """
-    Run a BB84 simulation for the given scenario using query parameters.
-    
-    Parameters:
-        scenario (ScenarioType): The scenario to simulate (maps to a specific simulation implementation).
-        qubit_count (int): Number of qubits to simulate (default 100).
-        error_rate (float): Channel error rate between 0.0 and 1.0 (default 0.0).
-        eve_fraction (float): Fraction of transmissions intercepted by an eavesdropper between 0.0 and 1.0 (default 0.0).
-    
-    Returns:
-        SimulationResult: The simulation outcome packaged as a SimulationResult model.
-    
-    Raises:
-        HTTPException: with status 400 if the scenario is invalid.
-        HTTPException: with status 500 if the simulation fails.
-    """
-    try:
-        if scenario not in SIMULATION_FUNCTIONS:
-            raise HTTPException(status_code=400, detail="Invalid scenario type")
-        
-        simulation_func = SIMULATION_FUNCTIONS[scenario]
-        
-        # Prepare parameters for the simulation
-        params = {
-            "qubit_count": qubit_count,
-            "error_rate": error_rate,
-            "eve_fraction": eve_fraction
-        }
-        
-        # Run the simulation
-        result = simulation_func(**params)
-        
-        return SimulationResult(**result)
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+def _make_get_handler(simulation_func):
+    """Build a GET handler bound to one simulation function."""
+    async def run_simulation_get(
+        qubit_count: int = Query(default=100, ge=10, le=1000),
+        error_rate: float = Query(default=0.0, ge=0.0, le=0.5),
+        eve_fraction: float = Query(default=0.0, ge=0.0, le=1.0)
+    ):
+        """
+        Run a BB84 simulation for this scenario using query parameters.
+
+        Parameters:
+            qubit_count (int): Number of qubits to simulate (default 100).
+            error_rate (float): Channel error rate between 0.0 and 0.5 (default 0.0).
+            eve_fraction (float): Fraction of transmissions intercepted by an eavesdropper between 0.0 and 1.0 (default 0.0).
+
+        Returns:
+            SimulationResult: The simulation outcome packaged as a SimulationResult model.
+
+        Raises:
+            HTTPException: with status 500 if the simulation fails.
+        """
+        try:
+            result = await run_in_pool(
+                simulation_func,
+                qubit_count=qubit_count,
+                error_rate=error_rate,
+                eve_fraction=eve_fraction
+            )
+            return SimulationResult(**result)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+    return run_simulation_get
+
+# Register one dedicated route per scenario so the router dispatches
+# straight to the right simulation function, with no per-request
+# enum-to-function lookup in the handler body
+for _scenario, _simulation_func in SIMULATION_FUNCTIONS.items():
+    app.add_api_route(
+        f"/simulate/{_scenario.value}",
+        _make_post_handler(_simulation_func),
+        methods=["POST"],
+        response_model=SimulationResult,
+        name=f"simulate_{_scenario.name.lower()}"
+    )
+    app.add_api_route(
+        f"/simulate/{_scenario.value}",
+        _make_get_handler(_simulation_func),
+        methods=["GET"],
+        response_model=SimulationResult,
+        name=f"simulate_{_scenario.name.lower()}_get"
+    )
 
 # Mount static files if frontend dist exists
 if FRONTEND_DIST.exists():
@@ -209,10 +271,13 @@ if FRONTEND_DIST.exists():
         if file_path.is_file():
             return FileResponse(file_path)
 
-        # Otherwise, serve index.html for client-side routing
+        # Otherwise, serve index.html for client-side routing.
+        # index.html must revalidate so clients see new asset hashes after a
+        # deploy; FileResponse's ETag/Last-Modified handling answers with 304
+        # when it is unchanged.
         index_path = FRONTEND_DIST / "index.html"
         if index_path.exists():
-            return FileResponse(index_path)
+            return FileResponse(index_path, headers={"Cache-Control": "no-cache"})
         else:
             raise HTTPException(status_code=404, detail="Frontend not built")
 else:
@@ -233,4 +298,15 @@ else:
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker imports main and builds its own cpu_count-sized
+    # SIMULATION_POOL, which already saturates the machine - default to a
+    # single server process and let WEB_CONCURRENCY opt in to more
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+    )
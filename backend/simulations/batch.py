@@ -0,0 +1,169 @@
+import numpy as np
+from typing import Dict, Any, Sequence
+from utils import generate_random_bit_arrays, generate_random_float_arrays
+import time
+
+def simulate_error_with_eve_batch(qubit_count: int, error_rates: Sequence[float],
+                                  eve_fractions: Sequence[float], **kwargs) -> Dict[str, Any]:
+    """
+    Run many error-with-Eve trials in one vectorized pass.
+
+    Parameter sweeps that call simulate_error_with_eve in a Python loop pay
+    the per-call overhead (RNG setup, sifting, dict construction) once per
+    trial. This entry point stacks all trials into (num_trials, qubit_count)
+    arrays and broadcasts the per-trial error_rate/eve_fraction as column
+    vectors, so the whole sweep is a handful of NumPy operations.
+
+    Args:
+        qubit_count: Number of qubits per trial
+        error_rates: Channel noise level for each trial
+        eve_fractions: Fraction of qubits Eve intercepts for each trial
+        (both sequences must have the same length)
+
+    Returns:
+        Dictionary with per-trial results in input order
+    """
+    start_time = time.perf_counter()
+
+    error_rates = np.asarray(error_rates, dtype=np.float64)
+    eve_fractions = np.asarray(eve_fractions, dtype=np.float64)
+    if error_rates.shape != eve_fractions.shape:
+        raise ValueError("error_rates and eve_fractions must have the same length")
+    num_trials = len(error_rates)
+
+    # One (num_trials, qubit_count) draw per bit/basis stream
+    alice_bits = generate_random_bit_arrays(num_trials, qubit_count)
+    alice_bases = generate_random_bit_arrays(num_trials, qubit_count)
+    eve_bases = generate_random_bit_arrays(num_trials, qubit_count)
+    bob_bases = generate_random_bit_arrays(num_trials, qubit_count)
+    intercept_roll = generate_random_float_arrays(num_trials, qubit_count)
+    flip_roll = generate_random_float_arrays(num_trials, qubit_count)
+    channel_roll = generate_random_float_arrays(num_trials, qubit_count)
+
+    # Eve's intercept-resend attack, broadcast across trials
+    eve_intercepts = intercept_roll < eve_fractions[:, None]
+    flip_mask = eve_intercepts & (alice_bases != eve_bases) & (flip_roll < 0.5)
+
+    # Channel noise after Eve, broadcast per-trial error rate
+    channel_errors = channel_roll < error_rates[:, None]
+
+    # Both disturbances are independent bit flips, so one fused XOR gives
+    # Bob's received bits for every trial
+    bob_bits = alice_bits ^ (flip_mask ^ channel_errors)
+
+    # Sift and compute QBER per trial with row reductions
+    matching_bases = alice_bases == bob_bases
+    matching_counts = np.count_nonzero(matching_bases, axis=1)
+    disagreements = np.count_nonzero((alice_bits != bob_bits) & matching_bases, axis=1)
+    qbers = np.divide(disagreements, matching_counts,
+                      out=np.zeros(num_trials, dtype=np.float64),
+                      where=matching_counts > 0)
+
+    expected_qbers = error_rates + 0.25 * eve_fractions
+    eve_detected = qbers > error_rates + 0.1
+
+    execution_time = time.perf_counter() - start_time
+
+    trials = [
+        {
+            "error_rate": err,
+            "eve_fraction": eve,
+            "qber": qber,
+            "expected_qber": expected,
+            "sifted_key_length": int(matched),
+            "eve_detected": bool(detected)
+        }
+        for err, eve, qber, expected, matched, detected in zip(
+            error_rates.tolist(), eve_fractions.tolist(), qbers.tolist(),
+            expected_qbers.tolist(), matching_counts.tolist(), eve_detected.tolist()
+        )
+    ]
+
+    return {
+        "scenario": "error-eve-batch",
+        "qubit_count": qubit_count,
+        "trial_count": num_trials,
+        "trials": trials,
+        "execution_time": execution_time
+    }
+
+def simulate_error_with_eve_batch_gpu(qubit_count: int, error_rates: Sequence[float],
+                                      eve_fractions: Sequence[float], **kwargs) -> Dict[str, Any]:
+    """
+    GPU variant of simulate_error_with_eve_batch using CuPy.
+
+    Every step of the batch pipeline is elementwise or a row reduction, so
+    it maps directly onto CuPy arrays; only the final per-trial scalars come
+    back to the host. Worthwhile for sweeps of thousands of trials at large
+    qubit counts, where the trial x qubit grid saturates GPU bandwidth.
+
+    CuPy is not a project dependency - importing it here keeps the CPU path
+    free of any GPU requirement. Raises RuntimeError if CuPy is unavailable.
+    """
+    try:
+        import cupy as cp
+    except ImportError as exc:
+        raise RuntimeError(
+            "simulate_error_with_eve_batch_gpu requires CuPy; "
+            "use simulate_error_with_eve_batch for the CPU path"
+        ) from exc
+
+    start_time = time.perf_counter()
+
+    error_rates = np.asarray(error_rates, dtype=np.float64)
+    eve_fractions = np.asarray(eve_fractions, dtype=np.float64)
+    if error_rates.shape != eve_fractions.shape:
+        raise ValueError("error_rates and eve_fractions must have the same length")
+    num_trials = len(error_rates)
+
+    rng = cp.random.default_rng()
+    shape = (num_trials, qubit_count)
+    alice_bits = rng.integers(0, 2, size=shape, dtype=cp.uint8)
+    alice_bases = rng.integers(0, 2, size=shape, dtype=cp.uint8)
+    eve_bases = rng.integers(0, 2, size=shape, dtype=cp.uint8)
+    bob_bases = rng.integers(0, 2, size=shape, dtype=cp.uint8)
+
+    err_col = cp.asarray(error_rates)[:, None]
+    eve_col = cp.asarray(eve_fractions)[:, None]
+
+    eve_intercepts = rng.random(shape) < eve_col
+    flip_mask = eve_intercepts & (alice_bases != eve_bases) & (rng.random(shape) < 0.5)
+    channel_errors = rng.random(shape) < err_col
+    bob_bits = alice_bits ^ (flip_mask ^ channel_errors)
+
+    matching_bases = alice_bases == bob_bases
+    matching_counts = cp.count_nonzero(matching_bases, axis=1)
+    disagreements = cp.count_nonzero((alice_bits != bob_bits) & matching_bases, axis=1)
+    qbers = cp.where(matching_counts > 0, disagreements / cp.maximum(matching_counts, 1), 0.0)
+
+    # One device-to-host transfer for all per-trial scalars
+    matching_counts = cp.asnumpy(matching_counts)
+    qbers = cp.asnumpy(qbers)
+
+    expected_qbers = error_rates + 0.25 * eve_fractions
+    eve_detected = qbers > error_rates + 0.1
+
+    execution_time = time.perf_counter() - start_time
+
+    trials = [
+        {
+            "error_rate": err,
+            "eve_fraction": eve,
+            "qber": qber,
+            "expected_qber": expected,
+            "sifted_key_length": int(matched),
+            "eve_detected": bool(detected)
+        }
+        for err, eve, qber, expected, matched, detected in zip(
+            error_rates.tolist(), eve_fractions.tolist(), qbers.tolist(),
+            expected_qbers.tolist(), matching_counts.tolist(), eve_detected.tolist()
+        )
+    ]
+
+    return {
+        "scenario": "error-eve-batch-gpu",
+        "qubit_count": qubit_count,
+        "trial_count": num_trials,
+        "trials": trials,
+        "execution_time": execution_time
+    }
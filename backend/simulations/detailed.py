@@ -1,11 +1,13 @@
 import numpy as np
 from typing import Dict, Any, List
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import generate_random_bits, generate_random_bases, sift_key, calculate_qber
+from utils import generate_random_bit_arrays, generate_random_float_arrays, sift_key, calculate_qber, bits_to_string
 import time
 
+# Label lookup tables indexed by basis (and bit) - replaces the
+# per-qubit conditionals in the hot dict-construction loop
+BASIS_LABELS = ("Z", "X")
+STATE_LABELS = (("|0⟩", "|1⟩"), ("|+⟩", "|-⟩"))  # [basis][bit]
+
 def simulate_detailed(qubit_count: int = 10, error_rate: float = 0.0, eve_fraction: float = 0.0, show_all: bool = False, **kwargs) -> Dict[str, Any]:
     """
     Generate a detailed step-by-step simulation of the BB84 protocol.
@@ -17,96 +19,92 @@ def simulate_detailed(qubit_count: int = 10, error_rate: float = 0.0, eve_fracti
         eve_fraction: Fraction of qubits Eve intercepts
         show_all: If False, limit to 20 qubits for readability. If True, show all qubits.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Limit to 20 qubits for detailed view unless show_all is True
     if not show_all:
         qubit_count = min(qubit_count, 20)
 
-    # Step 1: Alice generates random bits and bases
-    alice_bits = generate_random_bits(qubit_count)
-    alice_bases = generate_random_bases(qubit_count)
+    # Step 1: Alice generates random bits and bases; Eve's and Bob's
+    # measurement bases and Bob's wrong-basis outcomes come from the same
+    # fused draw, as do all three probability rolls
+    alice_bits, alice_bases, eve_bases, bob_bases, random_bits = generate_random_bit_arrays(5, qubit_count)
+    intercept_roll, flip_roll, channel_roll = generate_random_float_arrays(3, qubit_count)
 
     # Step 2: Eve's interception (if applicable)
-    eve_bits = alice_bits.copy()
-    eve_bases = generate_random_bases(qubit_count)
-    eve_intercepts = np.random.random(qubit_count) < eve_fraction
-
-    # Track Eve's interference
-    eve_caused_error = np.zeros(qubit_count, dtype=bool)
-
-    for i in range(qubit_count):
-        if eve_intercepts[i]:
-            if alice_bases[i] != eve_bases[i]:
-                # Wrong basis measurement causes 50% probability of error
-                if np.random.random() < 0.5:
-                    eve_bits[i] = 1 - alice_bits[i]
-                    eve_caused_error[i] = True
-
-    # Step 3: Bob generates random bases for measurement
-    bob_bases = generate_random_bases(qubit_count)
-
-    # Step 4: Apply channel noise
+    eve_intercepts = intercept_roll < eve_fraction
+
+    # Eve measuring in the wrong basis flips each intercepted bit
+    # with 50% probability
+    eve_caused_error = (
+        eve_intercepts
+        & (alice_bases != eve_bases)
+        & (flip_roll < 0.5)
+    )
+    # XOR with the flip mask allocates and writes Eve's bits in one pass
+    eve_bits = alice_bits ^ eve_caused_error
+
+    # Step 3: Apply channel noise
     final_bits = eve_bits.copy()
-    channel_errors = np.random.random(qubit_count) < error_rate
+    channel_errors = channel_roll < error_rate
     final_bits[channel_errors] = 1 - final_bits[channel_errors]
 
-    # Step 5: Bob measures
+    # Step 4: Bob measures
     # CRITICAL: When Bob uses the wrong basis, his measurement is RANDOM!
-    bob_bits = np.zeros(qubit_count, dtype=int)
     bases_match = alice_bases == bob_bases
+    bob_bits = np.where(bases_match, final_bits, random_bits)
 
-    for i in range(qubit_count):
-        if bases_match[i]:
-            # Correct basis: Bob gets the transmitted bit (with any channel/Eve errors)
-            bob_bits[i] = final_bits[i]
-        else:
-            # Wrong basis: Bob gets a RANDOM bit (quantum mechanics!)
-            bob_bits[i] = np.random.randint(0, 2)
-
-    # Step 6: Determine correctness
+    # Step 5: Determine correctness
     bits_match = alice_bits == bob_bits
 
-    # Create detailed qubit information
-    qubits_detail = []
-    for i in range(qubit_count):
-        qubit_info = {
+    # Create detailed qubit information.
+    # Convert each column to plain Python scalars once and zip them together -
+    # far cheaper than indexing NumPy arrays element by element in the loop.
+    columns = zip(
+        alice_bits.tolist(), alice_bases.tolist(), eve_intercepts.tolist(),
+        eve_bases.tolist(), eve_bits.tolist(), eve_caused_error.tolist(),
+        bob_bases.tolist(), bob_bits.tolist(), bases_match.tolist(),
+        bits_match.tolist(), channel_errors.tolist()
+    )
+    qubits_detail = [
+        {
             "index": i,
-            "alice_bit": int(alice_bits[i]),
-            "alice_basis": "Z" if alice_bases[i] == 0 else "X",
-            "alice_state": get_quantum_state(alice_bits[i], alice_bases[i]),
-            "eve_intercepted": bool(eve_intercepts[i]),
-            "eve_basis": "Z" if eve_bases[i] == 0 else "X" if eve_fraction > 0 else None,
-            "eve_measured": int(eve_bits[i]) if eve_intercepts[i] else None,
-            "eve_caused_error": bool(eve_caused_error[i]),
-            "bob_basis": "Z" if bob_bases[i] == 0 else "X",
-            "bob_measured": int(bob_bits[i]),
-            "bases_match": bool(bases_match[i]),
-            "bits_match": bool(bits_match[i]),
-            "channel_error": bool(channel_errors[i]),
-            "kept_in_key": bool(bases_match[i])
+            "alice_bit": a_bit,
+            "alice_basis": BASIS_LABELS[a_basis],
+            "alice_state": STATE_LABELS[a_basis][a_bit],
+            "eve_intercepted": intercepted,
+            "eve_basis": BASIS_LABELS[e_basis] if eve_fraction > 0 else None,
+            "eve_measured": e_bit if intercepted else None,
+            "eve_caused_error": e_error,
+            "bob_basis": BASIS_LABELS[b_basis],
+            "bob_measured": b_bit,
+            "bases_match": b_match,
+            "bits_match": bit_match,
+            "channel_error": ch_error,
+            "kept_in_key": b_match
         }
-        qubits_detail.append(qubit_info)
+        for i, (a_bit, a_basis, intercepted, e_basis, e_bit, e_error,
+                b_basis, b_bit, b_match, bit_match, ch_error) in enumerate(columns)
+    ]
 
-    # Sift the key
-    sifted_key_str, matching_bases = sift_key(alice_bits, bob_bits, alice_bases, bob_bases)
+    # Sift the key (kept as a uint8 array; stringified only for display)
+    sifted_bits, matching_bases = sift_key(alice_bits, bob_bits, alice_bases, bob_bases)
+    sifted_key_length = int(sifted_bits.size)
+    sifted_key_str = bits_to_string(sifted_bits)
 
     # Calculate QBER
     qber = calculate_qber(alice_bits, bob_bits, matching_bases)
 
-    execution_time = time.time() - start_time
+    execution_time = time.perf_counter() - start_time
 
-    # Count statistics
-    matching_bases_count = int(np.sum(bases_match))
-    correct_when_matched = int(np.sum(bits_match[bases_match]))
+    # Count statistics - count_nonzero on fused masks avoids both the
+    # int64 upcast of np.sum and the fancy-indexed temporaries
+    matching_bases_count = int(np.count_nonzero(bases_match))
+    not_matched_count = qubit_count - matching_bases_count
+    correct_when_matched = int(np.count_nonzero(bits_match & bases_match))
 
     # When bases don't match, the result should be random (50% correct)
-    if np.sum(~bases_match) > 0:
-        correct_when_not_matched = int(np.sum(bits_match[~bases_match]))
-        not_matched_count = int(np.sum(~bases_match))
-    else:
-        correct_when_not_matched = 0
-        not_matched_count = 0
+    correct_when_not_matched = int(np.count_nonzero(bits_match & ~bases_match))
 
     summary = {
         "total_qubits": qubit_count,
@@ -114,10 +112,10 @@ def simulate_detailed(qubit_count: int = 10, error_rate: float = 0.0, eve_fracti
         "non_matching_bases": not_matched_count,
         "correct_when_bases_match": correct_when_matched,
         "correct_when_bases_dont_match": correct_when_not_matched,
-        "eve_interceptions": int(np.sum(eve_intercepts)),
-        "eve_caused_errors": int(np.sum(eve_caused_error)),
-        "channel_errors": int(np.sum(channel_errors)),
-        "sifted_key_length": len(sifted_key_str),
+        "eve_interceptions": int(np.count_nonzero(eve_intercepts)),
+        "eve_caused_errors": int(np.count_nonzero(eve_caused_error)),
+        "channel_errors": int(np.count_nonzero(channel_errors)),
+        "sifted_key_length": sifted_key_length,
         "qber": qber
     }
 
@@ -126,7 +124,7 @@ def simulate_detailed(qubit_count: int = 10, error_rate: float = 0.0, eve_fracti
         "qubit_count": qubit_count,
         "qubits": qubits_detail,
         "sifted_key": sifted_key_str,
-        "sifted_key_length": len(sifted_key_str),
+        "sifted_key_length": sifted_key_length,
         "qber": qber,
         "error_rate": error_rate,
         "eve_fraction": eve_fraction,
@@ -141,7 +139,4 @@ def get_quantum_state(bit: int, basis: int) -> str:
     Z-basis (0): |0⟩ for bit 0, |1⟩ for bit 1
     X-basis (1): |+⟩ for bit 0, |-⟩ for bit 1
     """
-    if basis == 0:  # Z-basis
-        return "|0⟩" if bit == 0 else "|1⟩"
-    else:  # X-basis
-        return "|+⟩" if bit == 0 else "|-⟩"
+    return STATE_LABELS[basis][bit]
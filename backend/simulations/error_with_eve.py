@@ -1,11 +1,13 @@
-import numpy as np
 from typing import Dict, Any
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import generate_random_bits, generate_random_bases, apply_channel_error, sift_key, calculate_qber
+from utils import generate_random_bit_arrays, generate_random_float_arrays, apply_channel_error, sift_key, calculate_qber, bits_to_string
 import time
 
+# Static summary strings, interned once at import
+STATUS_EVE_DETECTED = "Eavesdropping detected"
+STATUS_EVE_POSSIBLE = "Eavesdropping may be present"
+SECURITY_COMPROMISED = "Compromised"
+SECURITY_POTENTIAL = "Potentially secure"
+
 def simulate_error_with_eve(qubit_count: int, error_rate: float = 0.05, eve_fraction: float = 0.5, **kwargs) -> Dict[str, Any]:
     """
     Simulate BB84 protocol with channel noise and Eve's intercept-resend attack.
@@ -40,42 +42,43 @@ def simulate_error_with_eve(qubit_count: int, error_rate: float = 0.05, eve_frac
     Returns:
         Dictionary with simulation results including QBER and security status
     """
-    start_time = time.time()
-    
-    # Step 1: Alice generates random bits and encodes them in random bases
-    alice_bits = generate_random_bits(qubit_count)
-    alice_bases = generate_random_bases(qubit_count)
+    start_time = time.perf_counter()
     
+    # Step 1: Alice generates random bits and encodes them in random bases;
+    # Eve's and Bob's measurement bases come from the same fused draw
+    alice_bits, alice_bases, eve_bases, bob_bases = generate_random_bit_arrays(4, qubit_count)
+
     # Step 2: Eve's intercept-resend attack
-    eve_bits = alice_bits.copy()
-    eve_bases = generate_random_bases(qubit_count)
-    
-    # Eve intercepts a fraction of qubits
-    eve_intercepts = np.random.random(qubit_count) < eve_fraction
-    
+    # Eve intercepts a fraction of qubits (both probability rolls come
+    # from one fused draw)
+    intercept_roll, flip_roll = generate_random_float_arrays(2, qubit_count)
+    eve_intercepts = intercept_roll < eve_fraction
+
     # When Eve intercepts, she may introduce errors due to basis mismatch
     # Physics: If Eve measures in wrong basis (50% probability),
     # she has 50% chance of getting wrong result → 25% total error rate
-    for i in range(qubit_count):
-        if eve_intercepts[i]:
-            if alice_bases[i] != eve_bases[i]:
-                # Wrong basis measurement causes 50% probability of error
-                if np.random.random() < 0.5:
-                    eve_bits[i] = 1 - alice_bits[i]
-    
-    # Step 3: Bob generates random bases for measurement
-    bob_bases = generate_random_bases(qubit_count)
+    basis_mismatch = alice_bases != eve_bases
+    flip_mask = eve_intercepts & basis_mismatch & (flip_roll < 0.5)
+    # XOR with the flip mask allocates and writes Eve's bits in one pass
+    eve_bits = alice_bits ^ flip_mask
     
-    # Step 4: Channel noise affects qubits after Eve's interference
+    # Step 3: Channel noise affects qubits after Eve's interference
     final_bits = apply_channel_error(eve_bits, error_rate)
     
-    # Step 5: Bob measures the final qubits
-    bob_bits = final_bits.copy()
-    
-    # Step 6: Basis sifting - Alice and Bob publicly compare bases
-    sifted_key_str, matching_bases = sift_key(alice_bits, bob_bits, alice_bases, bob_bases)
-    
-    # Step 7: Calculate QBER for security analysis
+    # Step 4: Bob measures the final qubits (apply_channel_error already
+    # returned a fresh array, so aliasing is safe)
+    bob_bits = final_bits
+    
+    # Step 5: Basis sifting - Alice and Bob publicly compare bases
+    # (key kept as a uint8 array; stringified only for display)
+    sifted_bits, matching_bases = sift_key(alice_bits, bob_bits, alice_bases, bob_bases)
+    sifted_key_length = int(sifted_bits.size)
+    # Only the first 100 bits are ever displayed, so never stringify the rest
+    sifted_key_str = bits_to_string(sifted_bits[:100])
+    if sifted_key_length > 100:
+        sifted_key_str += "..."
+
+    # Step 6: Calculate QBER for security analysis
     qber = calculate_qber(alice_bits, bob_bits, matching_bases)
     
     # Calculate theoretical QBER contribution from Eve
@@ -83,7 +86,7 @@ def simulate_error_with_eve(qubit_count: int, error_rate: float = 0.05, eve_frac
     eve_qber_contribution = 0.25 * eve_fraction
     expected_qber = error_rate + eve_qber_contribution
     
-    execution_time = time.time() - start_time
+    execution_time = time.perf_counter() - start_time
     
     # Security analysis
     # If QBER significantly exceeds channel noise, eavesdropping is detected
@@ -91,22 +94,23 @@ def simulate_error_with_eve(qubit_count: int, error_rate: float = 0.05, eve_frac
     
     summary = {
         "total_qubits": qubit_count,
-        "matching_bases": int(np.sum(matching_bases)),
-        "sifted_key_length": len(sifted_key_str),
+        # matching-bases count equals the sifted key length by construction
+        "matching_bases": sifted_key_length,
+        "sifted_key_length": sifted_key_length,
         "channel_error_rate": error_rate,
         "eve_fraction": eve_fraction,
         "expected_qber": expected_qber,
         "actual_qber": qber,
         "eve_detected": bool(eve_detected),
-        "protocol_status": "Eavesdropping detected" if eve_detected else "Eavesdropping may be present",
-        "security_level": "Compromised" if qber > 0.15 else "Potentially secure"
+        "protocol_status": STATUS_EVE_DETECTED if eve_detected else STATUS_EVE_POSSIBLE,
+        "security_level": SECURITY_COMPROMISED if qber > 0.15 else SECURITY_POTENTIAL
     }
     
     return {
         "scenario": "error-eve",
         "qubit_count": qubit_count,
-        "sifted_key": sifted_key_str[:100] + "..." if len(sifted_key_str) > 100 else sifted_key_str,
-        "sifted_key_length": len(sifted_key_str),
+        "sifted_key": sifted_key_str,
+        "sifted_key_length": sifted_key_length,
         "qber": qber,
         "error_rate": error_rate,
         "eve_fraction": eve_fraction,
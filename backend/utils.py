@@ -2,25 +2,63 @@ import numpy as np
 from typing import Tuple, List
 import time
 
-def generate_random_bits(length: int) -> np.ndarray:
+# Shared PCG64 generator - faster than the legacy global Mersenne Twister
+# and keeps all randomness in one place
+_RNG = np.random.default_rng()
+
+def generate_random_bits(length: int, rng: np.random.Generator = None) -> np.ndarray:
     """Generate random classical bits (0 or 1).
-    
+
     In BB84, Alice uses these random bits to encode her quantum states.
     Each bit represents the state she wants to send to Bob.
+
+    Pass a seeded Generator as rng for reproducible draws; the shared
+    module generator is used otherwise.
     """
-    return np.random.randint(0, 2, length)
+    return (rng or _RNG).integers(0, 2, length, dtype=np.uint8)
 
-def generate_random_bases(length: int) -> np.ndarray:
+def generate_random_bases(length: int, rng: np.random.Generator = None) -> np.ndarray:
     """Generate random measurement bases (0 for Z-basis, 1 for X-basis).
-    
+
     In BB84:
     - Z-basis (computational basis): measures |0⟩ and |1⟩ states
     - X-basis (Hadamard basis): measures |+⟩ and |-⟩ states
-    
-    Both Alice and Bob randomly choose bases. Security comes from the fact 
+
+    Both Alice and Bob randomly choose bases. Security comes from the fact
     that measuring in the wrong basis gives random results.
     """
-    return np.random.randint(0, 2, length)
+    return (rng or _RNG).integers(0, 2, length, dtype=np.uint8)
+
+def generate_random_bit_arrays(count: int, length: int, rng: np.random.Generator = None) -> np.ndarray:
+    """Draw several independent random bit arrays in one fused RNG call.
+
+    Returns a (count, length) uint8 array; row k is the k-th bit stream.
+    A simulation needs bits and bases for several parties, and one bulk
+    draw amortizes the per-call generator overhead that separate
+    generate_random_bits/generate_random_bases calls would each pay.
+    """
+    return (rng or _RNG).integers(0, 2, size=(count, length), dtype=np.uint8)
+
+def generate_random_float_arrays(count: int, length: int, rng: np.random.Generator = None) -> np.ndarray:
+    """Draw several uniform [0, 1) float arrays in one fused RNG call.
+
+    Returns a (count, length) array; row k is the k-th stream. Used for
+    probability rolls (interception, flips) so a simulation pays the
+    generator call overhead once instead of per stream. float32 gives
+    plenty of resolution for threshold comparisons at half the bandwidth.
+    """
+    return (rng or _RNG).random((count, length), dtype=np.float32)
+
+# Translation table mapping bytes 0x00/0x01 to ASCII '0'/'1'
+_BIT_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+
+def bits_to_string(bits: np.ndarray) -> str:
+    """Render a uint8 bit array as a '0'/'1' string.
+
+    tobytes + translate runs as a single C-level pass, unlike
+    ''.join(map(str, ...)) which allocates one Python string per bit.
+    """
+    return bits.tobytes().translate(_BIT_CHARS).decode('ascii')
 
 def compare_arrays(arr1: np.ndarray, arr2: np.ndarray) -> float:
     """Calculate the error rate between two binary arrays.
@@ -29,34 +67,38 @@ def compare_arrays(arr1: np.ndarray, arr2: np.ndarray) -> float:
     """
     if len(arr1) != len(arr2):
         raise ValueError("Arrays must have the same length")
-    errors = np.sum(arr1 != arr2)
+    # XOR marks disagreements without the boolean temporary arr1 != arr2
+    errors = np.count_nonzero(arr1 ^ arr2)
     return errors / len(arr1)
 
-def apply_channel_error(qubits: np.ndarray, error_rate: float) -> np.ndarray:
+def apply_channel_error(qubits: np.ndarray, error_rate: float, rng: np.random.Generator = None) -> np.ndarray:
     """Apply random bit flip errors to simulate noisy quantum channel.
     
     Simulates effects like photon loss, detector inefficiency, 
     environmental decoherence, and transmission errors.
     """
-    noisy_qubits = qubits.copy()
-    error_positions = np.random.random(len(qubits)) < error_rate
-    noisy_qubits[error_positions] = 1 - noisy_qubits[error_positions]
-    return noisy_qubits
+    flips = (rng or _RNG).random(len(qubits), dtype=np.float32) < error_rate
+    # XOR with the flip mask allocates and writes the noisy array in one
+    # pass, replacing the copy plus fancy-indexed scatter
+    return qubits ^ flips
 
-def sift_key(alice_bits: np.ndarray, bob_bits: np.ndarray, 
-             alice_bases: np.ndarray, bob_bases: np.ndarray) -> Tuple[str, np.ndarray]:
+def sift_key(alice_bits: np.ndarray, bob_bits: np.ndarray,
+             alice_bases: np.ndarray, bob_bases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """Perform basis sifting - keep only bits where bases matched.
-    
+
     Crucial BB84 step:
     1. Alice and Bob publicly announce their bases (not results!)
     2. Keep only bits where bases matched
     3. These form the sifted key
-    
+
     On average, bases match 50% of the time.
+
+    Returns the sifted key as a uint8 array plus the matching-bases mask;
+    callers stringify only what they display, so large keys never become
+    one-character-per-bit Python strings.
     """
     matching_bases = alice_bases == bob_bases
-    sifted_bits = alice_bits[matching_bases]
-    return ''.join(map(str, sifted_bits)), matching_bases
+    return alice_bits[matching_bases], matching_bases
 
 def calculate_qber(alice_bits: np.ndarray, bob_bits: np.ndarray, 
                    matching_bases: np.ndarray) -> float:
@@ -68,8 +110,16 @@ def calculate_qber(alice_bits: np.ndarray, bob_bits: np.ndarray,
     - >11%: Potentially insecure
     - >25%: Definitely compromised
     """
-    if np.sum(matching_bases) == 0:
+    matches = int(np.count_nonzero(matching_bases))
+    if matches == 0:
         return 0.0
-    alice_matched = alice_bits[matching_bases]
-    bob_matched = bob_bits[matching_bases]
-    return compare_arrays(alice_matched, bob_matched)
+    # Masking the XOR counts disagreements at matching positions directly,
+    # without materializing masked copies of either bit array
+    disagreements = (alice_bits ^ bob_bits) & matching_bases
+    if disagreements.size <= 256:
+        # Small keys: one POPCNT over the packed bytes beats the NumPy
+        # reduction's dispatch overhead (each byte is 0x00 or 0x01)
+        errors = int.from_bytes(disagreements.tobytes(), 'little').bit_count()
+    else:
+        errors = int(np.count_nonzero(disagreements))
+    return errors / matches